@@ -104,9 +104,8 @@ public function user_cannot_login_with_invalid_credentials(): void
                 ->type('@password-input', 'wrong-password')
                 ->waitFor('@login-button')
                 ->click('@login-button')
-                ->pause(100)
-                ->assertPathIs('/login/local')
                 ->waitFor('@email-error')
+                ->assertPathIs('/login/local')
                 ->assertVisible('@email-error')
                 ->assertSeeIn('@email-error', trans('auth.failed'));
         });
@@ -126,7 +125,7 @@ public function clicking_senhaunica_button_initiates_redirect(): void
             $browser->visit('/login/local')
                 ->waitFor('@senhaunica-login-button')
                 ->click('@senhaunica-login-button')
-                ->pause(100)
+                ->waitUntilMissing('@senhaunica-login-button')
                 ->assertPathIsNot('/login/local'); // Ensures a redirect happened
         });
     }
@@ -34,7 +34,6 @@ public function codpes_field_is_conditionally_displayed_and_required(): void
 
             // Check "Sou da USP" checkbox -> should appear and be required
             $browser->check('@is-usp-user-checkbox')
-                ->pause(150) // Increased pause slightly
                 ->waitFor('@codpes-container') // Use waitFor for visibility change
                 ->assertVisible('@codpes-container') // AC6
                 ->assertAttribute('@codpes-input', 'required', 'true'); // AC8
@@ -42,7 +41,6 @@ public function codpes_field_is_conditionally_displayed_and_required(): void
             // Uncheck "Sou da USP" checkbox -> should hide and not be required
             $browser->uncheck('@is-usp-user-checkbox')
                 // ->click('body') // Removed
-                ->pause(150) // Increased pause slightly
                 ->waitUntilMissing('@codpes-container') // Use waitUntilMissing
                 ->assertMissing('@codpes-container') // AC7
                 ->assertAttributeMissing('@codpes-input', 'required'); // AC8 - Check attribute is missing
@@ -51,7 +49,6 @@ public function codpes_field_is_conditionally_displayed_and_required(): void
             $browser->clear('@email-input')
                 ->type('@email-input', 'test@usp.br')
                 // ->click('body') // Removed
-                ->pause(150) // Increased pause slightly
                 ->waitFor('@codpes-container')
                 ->assertVisible('@codpes-container') // AC5
                 ->assertAttribute('@codpes-input', 'required', 'true'); // AC8
@@ -60,7 +57,6 @@ public function codpes_field_is_conditionally_displayed_and_required(): void
             $browser->clear('@email-input')
                 ->type('@email-input', 'another@example.com')
                 ->uncheck('@is-usp-user-checkbox')
-                ->pause(150) // Increased pause slightly
                 ->waitUntilMissing('@codpes-container') // Wait for element to disappear
                 ->assertMissing('@codpes-container') // AC7
                 ->assertAttributeMissing('@codpes-input', 'required'); // AC8 - Check attribute is missing